@@ -1,11 +1,12 @@
 import os
 import re
 import subprocess
+from functools import lru_cache
 from datetime import timedelta
 from typing import Any
 from collections.abc import Sequence
 
-from pymediainfo import Track, MediaInfo
+from pymediainfo import Track
 
 from .preprocess import Preprocessor, Resample
 from ..utils.files import make_output, ensure_path_exists
@@ -18,6 +19,8 @@ from ..utils.subprogress import run_cmd_pb, ProgressBarConfig
 
 __all__ = ["ensure_valid_in", "sanitize_trims", "format_from_track", "is_fancy_codec", "qaac_compatcheck", "has_libFDK"]
 
+_INT_OR_NONE = (int, type(None))
+
 
 def sanitize_pre(preprocess: Preprocessor | Sequence[Preprocessor] | None = None) -> list[Preprocessor]:
     if not preprocess:
@@ -40,9 +43,8 @@ def ensure_valid_in(
         msg = f"'{fileIn.file.name}' is a container with multiple tracks.\n"
         msg += f"The first audio track will be {'piped' if supports_pipe else 'extracted'} using default ffmpeg."
         warn(msg, caller, 5)
-    minfo = MediaInfo.parse(fileIn.file)
-    trackinfo = fileIn.get_mediainfo(minfo)
-    container = fileIn.get_containerinfo(minfo)
+    trackinfo = fileIn.get_mediainfo()
+    container = fileIn.get_containerinfo()
     has_containerfmt = container is not None and hasattr(container, "format") and container.format is not None
     preprocess = sanitize_pre(preprocess)
 
@@ -144,16 +146,15 @@ def sanitize_trims(
     caller = caller if caller else sanitize_trims
     if not isinstance(trims, (list, tuple)):
         raise error("Trims must be a list of 2-tuples (or just one 2-tuple)", caller)
-    if not isinstance(trims, list):
-        trims = [trims]
+    # Copy so the list passed by the user doesn't get modified
+    trims = list(trims) if isinstance(trims, list) else [trims]
     for index, trim in enumerate(trims):
         if not isinstance(trim, tuple):
             raise error(f"The trim {trim} is not a tuple", caller)
         if len(trim) != 2:
             raise error(f"The trim {trim} needs 2 elements", caller)
-        for i in trim:
-            if not isinstance(i, (int, type(None))):
-                raise error(f"The trim {trim} must have 2 ints or None's", caller)
+        if not isinstance(trim[0], _INT_OR_NONE) or not isinstance(trim[1], _INT_OR_NONE):
+            raise error(f"The trim {trim} must have 2 ints or None's", caller)
         if trim[-1] == 0:
             raise error("Slices cannot end with 0, if attempting to use an empty slice, use `None`", caller)
 
@@ -203,30 +204,40 @@ formats = [
 
 
 def format_from_track(track: Track) -> AudioFormat | None:
-    comm_name = getattr(track, "commercial_name", None)
-    compression_mode = str(getattr(track, "compression_mode", ""))
-    if comm_name and str(comm_name).lower() == "dts" and compression_mode.lower() == "lossy":
+    additional = getattr(track, "format_additionalfeatures", None)
+    return _format_from_fields(
+        str(track.format),
+        str(additional) if additional else "",
+        str(track.codec_id),
+        str(getattr(track, "commercial_name", None) or ""),
+        str(getattr(track, "compression_mode", "")),
+    )
+
+
+@lru_cache(maxsize=64)
+def _format_from_fields(format: str, additional: str, codec_id: str, comm_name: str, compression_mode: str) -> AudioFormat | None:
+    # Cached on the relevant track fields since the same few formats get looked up over and over
+    if comm_name.lower() == "dts" and compression_mode.lower() == "lossy":
         return formats[-1]
 
-    for format in formats:
-        f = str(track.format)
-        if hasattr(track, "format_additionalfeatures") and track.format_additionalfeatures:
-            f = f"{f} {track.format_additionalfeatures}"
-        if "*" in format.format:
-            # matches = filter([f.lower()], format.format.lower())
-            if re.match(format.format.replace("*", ".*"), f, re.IGNORECASE):
-                return format
+    f = f"{format} {additional}" if additional else format
+    f_cf = f.casefold()
+    codec_id_cf = codec_id.casefold()
+
+    for form in formats:
+        if form._format_pattern:
+            if form._format_pattern.match(f):
+                return form
         else:
-            if format.format.casefold() == f.casefold():
-                return format
+            if form._format_cf == f_cf:
+                return form
 
-        if "*" in format.codecid:
-            # matches = filter([str(track.codec_id).lower()], format.codecid)
-            if re.match(format.codecid.replace("*", ".*"), str(track.codec_id), re.IGNORECASE):
-                return format
+        if form._codecid_pattern:
+            if form._codecid_pattern.match(codec_id):
+                return form
         else:
-            if format.codecid.casefold() == str(track.codec_id).casefold():
-                return format
+            if form._codecid_cf == codec_id_cf:
+                return form
     return None
 
 
@@ -270,8 +281,9 @@ def is_fancy_codec(track: Track) -> bool:
     :param track:   Input track to check
     """
     codec_id = str(track.codec_id).casefold()
-    if codec_id == "A_TRUEHD".casefold() or "truehd" in track.commercial_name.lower():
-        if "atmos" in track.commercial_name.lower():
+    commercial_name = track.commercial_name.lower()
+    if codec_id == "A_TRUEHD".casefold() or "truehd" in commercial_name:
+        if "atmos" in commercial_name:
             return True
         if not hasattr(track, "format_additionalfeatures") or not track.format_additionalfeatures:
             return False
@@ -282,26 +294,27 @@ def is_fancy_codec(track: Track) -> bool:
         if not hasattr(track, "format_additionalfeatures") or not track.format_additionalfeatures:
             return False
         # If those additional features contain something after removing "XLL" its some fancy stuff
-        return bool(re.sub("XLL", "", str(track.format_additionalfeatures).strip(), re.IGNORECASE))
+        return bool(str(track.format_additionalfeatures).upper().replace("XLL", "").strip())
 
     return False
 
 
+@lru_cache(maxsize=None)
 def has_libFDK() -> bool:
     """
-    Returns if whatever installation of ffmpeg being used has been compiled with libFDK
+    Returns if whatever installation of ffmpeg being used has been compiled with libFDK.
+    The result is cached for the lifetime of the process. Use `has_libFDK.cache_clear()` if you swap binaries mid-run.
     """
     exe = get_executable("ffmpeg")
     _, readout = communicate_stdout([exe, "-encoders"])
-    for line in readout.splitlines():
-        if "libfdk_aac" in line.lower():
-            return True
-    return False
+    return "libfdk_aac" in readout.lower()
 
 
+@lru_cache(maxsize=None)
 def qaac_compatcheck() -> str:
     """
     Checks if the qAAC installation has libflac and returns the qaac version.
+    The result is cached for the lifetime of the process. Failed checks are not cached.
     """
     exe = get_executable("qaac")
     _, readout = communicate_stdout([exe, "--check"])
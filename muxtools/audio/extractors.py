@@ -1,10 +1,13 @@
 from shlex import split as splitcommand
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from fractions import Fraction
+from math import ceil, floor
 from typing import Sequence
 from pathlib import Path
 import os
+import subprocess
 import re
 
 from .audioutils import format_from_track, is_fancy_codec, sanitize_trims, ensure_valid_in, duration_from_file
@@ -23,6 +26,7 @@ __all__ = ["Eac3to", "Sox", "FFMpeg", "MkvExtract"]
 
 
 EAC3TO_DELAY_REGEX = r"remaining delay of (?P<delay>(?:-|\+)?\d+)ms could not"
+_EAC3TO_DELAY_PATTERN = re.compile(EAC3TO_DELAY_REGEX)
 
 
 def _escape_name(s: str) -> str:
@@ -63,21 +67,32 @@ class Eac3to(Extractor):
         info(f"Extracting audio track {self.track} from '{input.stem}'...", self)
 
         out = make_output(input, extension, f"extracted_{self.track}", self.output)
-        code, stdout = communicate_stdout(f'"{eac3to}" "{input}" {track.track_id+1}: "{out}" {self.append}')
+        args = [eac3to, str(input), f"{track.track_id+1}:", str(out)]
+        command: str | list[str] = args
+        if self.append:
+            # Pass the user's string on verbatim on windows as posix shlex would eat the backslashes in paths
+            if os.name == "nt":
+                command = f"{subprocess.list2cmdline(args)} {self.append}"
+            else:
+                args.extend(splitcommand(self.append))
+        code, stdout = communicate_stdout(command)
         if code == 0:
             if not out.exists():
-                pattern_str = rf"{re.escape(out.stem)} DELAY.*\.{extension}"
-                pattern = re.compile(pattern_str, re.IGNORECASE)
-                for f in os.listdir(out.parent):
-                    if pattern.match(f):
-                        f = Path(out.parent, f)
+                # eac3to appends the delay to the output name
+                pattern = re.compile(rf"{re.escape(out.stem)} DELAY.*\.{re.escape(extension)}", re.IGNORECASE)
+                prefix = f"{out.stem} DELAY".lower()
+                with os.scandir(out.parent) as entries:
+                    for entry in entries:
+                        # Cheap prefix check before running the regex on every file in the directory
+                        if not entry.name.lower().startswith(prefix) or not pattern.match(entry.name):
+                            continue
+                        f = Path(entry.path)
                         out = f.rename(f.with_stem(out.stem))
                         break
             delay = 0
 
-            pattern = re.compile(EAC3TO_DELAY_REGEX)
             for line in stdout.splitlines():
-                match = re.search(pattern, line)
+                match = _EAC3TO_DELAY_PATTERN.search(line)
                 if match:
                     delay = int(match.group("delay"))
                     debug(f"Additional delay of {delay} ms will be applied to fix remaining sync.", self)
@@ -134,7 +149,7 @@ class FFMpeg(HasExtractor, HasTrimmer):
                 extension = form.ext
                 out = make_output(input, extension, f"extracted_{self.track}", self.output, temp=is_temp)
 
-            args = [ffmpeg, "-hide_banner", "-i", str(input.resolve()), "-map_chapters", "-1", "-map", f"0:a:{self.track}"]
+            args = [ffmpeg, "-hide_banner", "-i", str(input), "-map_chapters", "-1", "-map", f"0:a:{self.track}"]
 
             specified_depth = getattr(track, "bit_depth", 16)
             if str(specified_depth) not in ainfo.stats.bit_depth and not lossy and not is_fancy_codec(track) and specified_depth is not None:
@@ -186,36 +201,35 @@ class FFMpeg(HasExtractor, HasTrimmer):
         num_frames: int = 0
         output: PathLike | None = None
 
-        def _calc_delay(self, delay: int = 0, num_samples: int = 0, sample_rate: int = 48000) -> int:
+        @staticmethod
+        def _calc_delay(delay: int = 0, num_samples: int = 0, sample_rate: int = 48000) -> int:
             """
             Calculates the delay needed to fix the remaining sync for lossy audio.
             """
-            from math import ceil, floor
-
             frame = num_samples * 1000 / sample_rate
             leftover = (round(delay / frame) * frame) - delay
             return ceil(leftover) if leftover > 0 else floor(leftover)
 
-        def _targs(self, trim: Trim) -> str:
+        def _targs(self, trim: Trim) -> list[str]:
             """
             Converts trim to ffmpeg seek args.
             """
-            arg = ""
+            args = list[str]()
             if trim[1] and trim[1] < 0 and not self.trim_use_ms:
                 raise error("Negative input is not allowed for ms based trims.", FFMpeg())
 
             if trim[0] is not None and trim[0] > 0:
                 if self.trim_use_ms:
-                    arg += f" -ss {format_timedelta(timedelta(milliseconds=trim[0]))}"
+                    args.extend(["-ss", format_timedelta(timedelta(milliseconds=trim[0]))])
                 else:
-                    arg += f" -ss {format_timedelta(frame_to_timedelta(trim[0], self.fps))}"
+                    args.extend(["-ss", format_timedelta(frame_to_timedelta(trim[0], self.fps))])
             if trim[1] is not None and trim[1] != 0:
                 end_frame = self.num_frames + trim[1] if trim[1] < 0 else trim[1]
                 if self.trim_use_ms:
-                    arg += f" -to {format_timedelta(timedelta(milliseconds=trim[1]))}"
+                    args.extend(["-to", format_timedelta(timedelta(milliseconds=trim[1]))])
                 else:
-                    arg += f" -to {format_timedelta(frame_to_timedelta(end_frame, self.fps))}"
-            return arg
+                    args.extend(["-to", format_timedelta(frame_to_timedelta(end_frame, self.fps))])
+            return args
 
         def trim_audio(self, input: AudioFile, quiet: bool = True) -> AudioFile:
             if not isinstance(input, AudioFile):
@@ -227,7 +241,7 @@ class FFMpeg(HasExtractor, HasTrimmer):
             if not form and lossy:
                 raise error(f"Unrecognized lossy format: {minfo.format}", self)
 
-            args = [get_executable("ffmpeg"), "-hide_banner", "-i", str(input.file.resolve()), "-map", "0:a:0"]
+            args = [get_executable("ffmpeg"), "-hide_banner", "-i", str(input.file), "-map", "0:a:0"]
             if lossy or is_fancy_codec(minfo):
                 args.extend(["-c:a", "copy"])
                 extension = form.ext
@@ -236,20 +250,25 @@ class FFMpeg(HasExtractor, HasTrimmer):
                 extension = "flac"
 
             out = make_output(input.file, extension, "trimmed", self.output)
-            ainfo = parse_audioinfo(input.file, caller=self) if not input.info else input.info
+
+            def num_samples() -> int:
+                # Only needed for the delay calculation of lossy trims so this is parsed lazily and kept on the input
+                if not input.info:
+                    input.info = parse_audioinfo(input.file, caller=self)
+                return input.info.num_samples()
 
             if len(self.trim) == 1:
                 info(f"Trimming '{input.file.stem}' with ffmpeg...", self)
                 tr = self.trim[0]
                 if lossy:
-                    args[2:1] = splitcommand(self._targs(tr))
+                    args[2:1] = self._targs(tr)
                 else:
-                    args.extend(splitcommand(self._targs(tr)))
-                args.append(str(out.resolve()))
+                    args.extend(self._targs(tr))
+                args.append(str(out))
                 if not run_commandline(args, quiet):
                     if tr[0] and lossy:
                         ms = tr[0] if self.trim_use_ms else frame_to_ms(tr[0], self.fps)
-                        cont_delay = self._calc_delay(ms, ainfo.num_samples(), getattr(minfo, "sampling_rate", 48000))
+                        cont_delay = self._calc_delay(ms, num_samples(), getattr(minfo, "sampling_rate", 48000))
                         debug(f"Additional delay of {cont_delay} ms will be applied to fix remaining sync", self)
                         if self.preserve_delay:
                             cont_delay += input.container_delay
@@ -267,13 +286,19 @@ class FFMpeg(HasExtractor, HasTrimmer):
                 for i, tr in enumerate(self.trim):
                     nArgs = args.copy()
                     if lossy:
-                        nArgs[2:1] = splitcommand(self._targs(tr))
+                        nArgs[2:1] = self._targs(tr)
                         if first:
-                            cont_delay = self._calc_delay(ms, ainfo.num_samples(), getattr(minfo, "sampling_rate", 48000))
-                            debug(f"Additional delay of {cont_delay} ms will be applied to fix remaining sync", self)
+                            if tr[0]:
+                                ms = tr[0] if self.trim_use_ms else frame_to_ms(tr[0], self.fps)
+                                cont_delay = self._calc_delay(ms, num_samples(), getattr(minfo, "sampling_rate", 48000))
+                                debug(f"Additional delay of {cont_delay} ms will be applied to fix remaining sync", self)
+                                if self.preserve_delay:
+                                    cont_delay += input.container_delay
+                            else:
+                                cont_delay = input.container_delay if self.preserve_delay else 0
                             first = False
                     else:
-                        nArgs.extend(splitcommand(self._targs(tr)))
+                        nArgs.extend(self._targs(tr))
                         if first:
                             cont_delay = input.container_delay if self.preserve_delay else 0
                             first = False
@@ -290,7 +315,7 @@ class FFMpeg(HasExtractor, HasTrimmer):
 
                 args[3] = concat_f
                 args[2:1] = ["-f", "concat", "-safe", "0"]
-                args.append(str(out.resolve()))
+                args.append(str(out))
 
                 if not run_commandline(args, quiet):
                     debug("Done", self)
@@ -328,7 +353,7 @@ class FFMpeg(HasExtractor, HasTrimmer):
 
             concat_file = get_temp_workdir() / "concat.txt"
             with open(concat_file, "w", encoding="utf-8") as f:
-                f.writelines([f"file {_escape_name(str(af.file.resolve()))}\n" for af in audio_files])
+                f.writelines([f"file {_escape_name(str(af.file))}\n" for af in audio_files])
 
             first_format = format_from_track(audio_files[0].get_mediainfo())
 
@@ -388,6 +413,13 @@ class Sox(Trimmer):
         else:
             return frame_to_timedelta(abs(val), self.fps).total_seconds()
 
+    def _apply_trim(self, soxr, t: Trim, first: bool):
+        if first and t[0] is not None and t[0] < 0:
+            soxr.trim(0, self._conv(t[1]))
+            soxr.pad(self._conv(t[0]))
+        else:
+            soxr.trim(self._conv(t[0]) or 0, self._conv(t[1]))
+
     def trim_audio(self, input: AudioFile, quiet: bool = True) -> AudioFile:
         import sox
 
@@ -398,41 +430,37 @@ class Sox(Trimmer):
         source = ensure_valid_in(input, caller=self, supports_pipe=False)
 
         if len(self.trim) > 1:
-            files_to_concat = []
-            first = True
-            info(f"Generating trimmed tracks for '{input.file.stem}'...", self)
-            for i, t in enumerate(self.trim):
+            source_file = str(source.file)
+            tempdir = get_temp_workdir()
+            stem = input.file.stem
+
+            def build_part(i: int, t: Trim) -> str:
                 soxr = sox.Transformer()
                 soxr.set_globals(multithread=True, verbosity=0 if quiet else 1)
-                if t[0] < 0 and first:
-                    soxr.trim(0, self._conv(t[1]))
-                    soxr.pad(self._conv(t[0]))
-                else:
-                    soxr.trim(self._conv(t[0]), self._conv(t[1]))
-                first = False
-                tout = os.path.join(get_temp_workdir(), f"{input.file.stem}_trimmed_part{i}.wav")
-                soxr.build(str(source.file.resolve()), tout)
-                files_to_concat.append(tout)
+                self._apply_trim(soxr, t, i == 0)
+                tout = os.path.join(tempdir, f"{stem}_trimmed_part{i}.wav")
+                soxr.build(source_file, tout)
+                return tout
+
+            info(f"Generating trimmed tracks for '{stem}'...", self)
+            # Every part is its own sox process so they can be built concurrently
+            with ThreadPoolExecutor(max_workers=min(len(self.trim), os.cpu_count() or 1)) as executor:
+                files_to_concat = list(executor.map(build_part, range(len(self.trim)), self.trim))
 
             info("Concatenating the tracks...", self)
             soxr = sox.Combiner()
             soxr.set_globals(multithread=True, verbosity=0 if quiet else 1)
             formats = ["wav" for file in files_to_concat]
             soxr.set_input_format(file_type=formats)
-            soxr.build(files_to_concat, str(out.resolve()), "concatenate")
+            soxr.build(files_to_concat, str(out), "concatenate")
             debug("Done", self)
         else:
             soxr = sox.Transformer()
             soxr.set_globals(multithread=True, verbosity=0 if quiet else 1)
             info(f"Applying trim to '{input.file.stem}'", self)
-            t = self.trim[0]
-            if t[0] < 0:
-                soxr.trim(0, self._conv(t[1]))
-                soxr.pad(self._conv(t[0]))
-            else:
-                soxr.trim(self._conv(t[0]), self._conv(t[1]))
-            soxr.build(str(source.file), str(out.resolve()))
+            self._apply_trim(soxr, self.trim[0], True)
+            soxr.build(str(source.file), str(out))
             debug("Done", self)
 
         clean_temp_files()
-        return AudioFile(out.resolve(), input.container_delay if self.preserve_delay else 0, input.source)
+        return AudioFile(out, input.container_delay if self.preserve_delay else 0, input.source)
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any
 import subprocess
 import wget
+import json
 import re
 import os
 
@@ -18,7 +19,7 @@ from ..misc.chapters import Chapters
 from .tracks import Attachment, _track
 from ..utils.download import get_executable
 from ..utils.log import debug, error, info, warn, danger
-from ..utils.env import get_setup_attr, get_setup_dir, get_workdir, run_commandline
+from ..utils.env import get_setup_attr, get_setup_dir, get_workdir, get_temp_workdir, run_commandline
 from ..utils.files import ensure_path, ensure_path_exists, get_crc32, clean_temp_files
 
 __all__ = ["mux"]
@@ -26,6 +27,11 @@ __all__ = ["mux"]
 
 writing_lib_regex = re.compile(r"libebml.v(\d.\d.\d).+?libmatroska.v(\d.\d.\d)", re.I)
 
+token_regex = re.compile(r"\$(show|ep|crc32)\$")
+
+# Windows caps command lines at 32767 characters so leave some headroom
+MAX_CMDLINE_LENGTH = 30000
+
 
 def mux(*tracks, tmdb: TmdbConfig | None = None, outfile: PathLike | None = None, quiet: bool = True, print_cli: bool = False) -> PathLike:
     """
@@ -72,7 +78,7 @@ def mux(*tracks, tmdb: TmdbConfig | None = None, outfile: PathLike | None = None
             # Failsave for if someone passes Chapters().to_file() or a txt/xml file
             track = ensure_path_exists(track, "Mux")
             if track.suffix.lower() in [".txt", ".xml"]:
-                args.extend(["--chapters", track.resolve()])
+                args.extend(["--chapters", str(track)])
                 continue
         elif track is None:
             continue
@@ -85,6 +91,14 @@ def mux(*tracks, tmdb: TmdbConfig | None = None, outfile: PathLike | None = None
     if print_cli:
         info(joincommand(args), "Mux")
 
+    if len(subprocess.list2cmdline(args)) > MAX_CMDLINE_LENGTH:
+        # Lots of tracks and attachments (fonts) can exceed the limit so pass them as a json option file instead
+        options_file = Path(get_temp_workdir(), "mkvmerge_options.json")
+        with open(options_file, "w", encoding="utf-8") as f:
+            json.dump([str(arg) for arg in args[1:]], f, ensure_ascii=False)
+        debug(f"Command line too long, passing options via '{options_file.name}'...", "Mux")
+        args = [args[0], f"@{options_file}"]
+
     debug("Running the mux...", "Mux")
     if run_commandline(args, quiet, mkvmerge=True) > 1:
         raise error("Muxing failed!", "Mux")
@@ -102,14 +116,14 @@ def mux(*tracks, tmdb: TmdbConfig | None = None, outfile: PathLike | None = None
 
         if mkvpropedit and muxing_application and (match := writing_lib_regex.search(muxing_application)):
             muxing_application = f"libebml v{match.group(1)} + libmatroska v{match.group(2)}" + version_tag
-            args = [mkvpropedit, "--edit", "info", "--set", f"muxing-application={muxing_application}", str(outfile.resolve())]
+            args = [mkvpropedit, "--edit", "info", "--set", f"muxing-application={muxing_application}", str(outfile)]
             run_commandline(args)
     except:
         pass
 
     if "#crc32#" in outfile.stem:
         debug("Generating CRC32 for the muxed file...", "Mux")
-        outfile = outfile.rename(outfile.with_stem(re.sub(re.escape("#crc32#"), get_crc32(outfile), outfile.stem)))
+        outfile = outfile.rename(outfile.with_stem(outfile.stem.replace("#crc32#", get_crc32(outfile))))
 
     if get_setup_attr("clean_work_dirs", False):
         if os.path.samefile(get_workdir(), os.getcwd()):
@@ -166,8 +180,8 @@ def output_names(tmdb: TmdbConfig | None = None, args: list[str] = [], tracks: l
         if tmdb and not tmdb.movie:
             danger(f"{episode} is not a valid integer! TMDB will be skipped.", "Mux", 3)
             tmdb = None
-            filename = clean_name(re.sub(re.escape(R"$title$"), "", filename))
-            title = clean_name(re.sub(re.escape(R"$title$"), "", title))
+            filename = clean_name(filename.replace(R"$title$", ""))
+            title = clean_name(title.replace(R"$title$", ""))
 
     if tmdb:
         debug("Fetching tmdb metadata...", "Mux")
@@ -183,29 +197,25 @@ def output_names(tmdb: TmdbConfig | None = None, args: list[str] = [], tracks: l
                 if wget.download(epmeta.thumb_url, str(cover), None):
                     tracks.append(Attachment(cover, "image/jpeg" if cover.suffix.lower() == ".jpg" else "image/png"))
 
-            filename = re.sub(re.escape(R"$title$"), epmeta.title, filename)
-            title = re.sub(re.escape(R"$title$"), epmeta.title, title)
+            filename = filename.replace(R"$title$", epmeta.title)
+            title = title.replace(R"$title$", epmeta.title)
 
     for attribute in get_setup_dir():
         attr = get_setup_attr(attribute, None)
         if not attr or not isinstance(attr, str):
             continue
-        try:
-            replace = re.escape(Rf"${str(attribute)}$")
-            filename = re.sub(replace, attr, filename)
-            title = re.sub(replace, attr, title)
-        except:
-            continue
+        token = Rf"${str(attribute)}$"
+        filename = filename.replace(token, attr)
+        title = title.replace(token, attr)
 
     filename = clean_name(filename)
     title = clean_name(title)
 
-    filename = re.sub(re.escape(R"$show$"), show_name, filename)
-    filename = re.sub(re.escape(R"$ep$"), episode, filename)
-    filename = re.sub(re.escape(R"$crc32$"), "#crc32#", filename)
-
-    title = re.sub(re.escape(R"$show$"), show_name, title)
-    title = re.sub(re.escape(R"$ep$"), episode, title)
+    # Single pass for all tokens, a function replacement also doesn't choke on backslashes in the names
+    tokens = {"show": show_name, "ep": episode, "crc32": "#crc32#"}
+    filename = token_regex.sub(lambda m: tokens[m.group(1)], filename)
+    tokens.pop("crc32")
+    title = token_regex.sub(lambda m: tokens.get(m.group(1), m.group(0)), title)
 
     return (filename, title)
 
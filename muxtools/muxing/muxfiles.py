@@ -1,5 +1,5 @@
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pymediainfo import MediaInfo, Track
 from datetime import timedelta
 from typing import Any
@@ -11,7 +11,7 @@ from ..utils.glob import GlobSearch
 from ..utils.env import run_commandline
 from ..utils.download import get_executable
 from ..utils.types import AudioInfo, PathLike
-from ..utils.files import ensure_path, ensure_path_exists
+from ..utils.files import ensure_path, ensure_path_exists, _file_key
 
 __all__ = [
     "FileMixin",
@@ -90,18 +90,26 @@ class VideoFile(MuxingFile):
 class AudioFile(MuxingFile):
     info: AudioInfo | None = None
     duration: timedelta | None = None
+    _mediainfo: tuple[tuple[str, int, int], MediaInfo] | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         self.file = ensure_path_exists(self.file, self)
 
+    def _parse_mediainfo(self) -> MediaInfo:
+        # Keyed on path, mtime and size so a replaced or modified file gets parsed again
+        key = _file_key(self.file)
+        if self._mediainfo is None or self._mediainfo[0] != key:
+            self._mediainfo = (key, MediaInfo.parse(self.file))
+        return self._mediainfo[1]
+
     def get_containerinfo(self, mediainfo: MediaInfo | None = None) -> Track:
         if not mediainfo:
-            mediainfo = MediaInfo.parse(self.file)
+            mediainfo = self._parse_mediainfo()
         return mediainfo.general_tracks[0]
 
     def get_mediainfo(self, mediainfo: MediaInfo | None = None) -> Track:
         if not mediainfo:
-            mediainfo = MediaInfo.parse(self.file)
+            mediainfo = self._parse_mediainfo()
         return mediainfo.audio_tracks[0]
 
     def is_lossy(self) -> bool:
@@ -116,10 +124,17 @@ class AudioFile(MuxingFile):
 
     def has_multiple_tracks(self, caller: Any = None) -> bool:
         fileIn = ensure_path_exists(self.file, caller)
-        minfo = MediaInfo.parse(fileIn)
-        if len(minfo.audio_tracks) > 1 or len(minfo.video_tracks) > 1 or len(minfo.text_tracks) > 1:
-            return True
-        elif len(minfo.audio_tracks) == 0:
+        minfo = self._parse_mediainfo()
+        # Single pass over the tracks that bails as soon as any type shows up twice
+        counts = {"audio": 0, "video": 0, "text": 0}
+        for track in minfo.tracks:
+            ttype = track.track_type.lower()
+            if ttype not in counts:
+                continue
+            counts[ttype] += 1
+            if counts[ttype] > 1:
+                return True
+        if not counts["audio"]:
             raise error(f"'{fileIn.name}' does not contain an audio track!", caller)
         return False
 
@@ -133,7 +148,7 @@ class AudioFile(MuxingFile):
         mkv = get_executable("mkvmerge")
         self.file = ensure_path_exists(self.file, self)
         out = self.file.with_suffix(".mka")
-        args = [mkv, "-o", str(out.resolve()), "--audio-tracks", "0"]
+        args = [mkv, "-o", str(out), "--audio-tracks", "0"]
         if self.container_delay:
             args.extend(["--sync", f"0:{self.container_delay}"])
         args.append(str(self.file))
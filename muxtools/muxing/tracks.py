@@ -62,7 +62,7 @@ class _track:
         self.tags = tags
 
     def mkvmerge_args(self) -> list[str]:
-        filepath = str(self.file.resolve())
+        filepath = str(self.file)
         if self.type == TrackType.ATTACHMENT:
             is_font = self.file.suffix.lower() in [".ttf", ".otf", ".ttc", ".otc"]
             if not is_font and not self.lang:
@@ -130,7 +130,7 @@ class VideoTrack(_track):
         tags: dict[str, str] | None = None,
     ) -> None:
         if timecode_file is not None:
-            args.extend(["--timestamps", f"0:{ensure_path_exists(timecode_file, self).resolve()}"])
+            args.extend(["--timestamps", f"0:{ensure_path_exists(timecode_file, self)}"])
         if crop:
             if isinstance(crop, int):
                 crop = tuple([crop] * 4)
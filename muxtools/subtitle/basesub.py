@@ -7,6 +7,7 @@ from enum import IntEnum
 
 from ..utils.log import error, warn
 from ..utils.types import PathLike
+from ..utils.files import _file_key
 from ..muxing.muxfiles import MuxingFile
 
 __all__ = ["_Line", "ASSHeader"]
@@ -98,7 +99,11 @@ class BaseSubFile(ABC, MuxingFile):
     Mostly contains the functions to read/write the file and some commonly reused functions to manipulate headers/lines.
     """
 
+    _doc_cache: tuple[tuple[str, int, int], Document] | None = None
+
     def _read_doc(self, file: PathLike | None = None) -> Document:
+        if not file and (cached := self.__take_cached_doc()):
+            return cached
         with open(self.file if not file else file, "r", encoding=self.encoding) as reader:
             doc = parseDoc(reader)
             self.__fix_style_definition(doc)
@@ -107,6 +112,21 @@ class BaseSubFile(ABC, MuxingFile):
     def _update_doc(self, doc: Document):
         with open(self.file, "w", encoding=self.encoding) as writer:
             doc.dump_file(writer)
+        self._doc_cache = (_file_key(self.file), doc)
+
+    def __take_cached_doc(self) -> Document | None:
+        """
+        Returns the document last written by `_update_doc` if the file hasn't changed since.
+        The cache is handed over and cleared so a caller mutating the document without writing it can't leave a stale copy behind.
+        """
+        cached = self._doc_cache
+        if not cached:
+            return None
+        self._doc_cache = None
+        try:
+            return cached[1] if cached[0] == _file_key(self.file) else None
+        except OSError:
+            return None
 
     def __fix_style_definition(self, doc: Document):
         fields: list[str] = doc.styles.field_order
@@ -2,6 +2,7 @@ import re
 import shutil
 import logging
 from pathlib import Path
+from functools import lru_cache
 from font_collector import ABCFontFace, VariableFontFace
 
 from .sub import SubFile, FontFile as MTFontFile
@@ -65,6 +66,14 @@ def _get_fontname(font: ABCFontFace) -> str:
     return name
 
 
+@lru_cache(maxsize=1)
+def _load_system_fonts() -> tuple:
+    # Scanning the system fonts is the slow part so only do it once per process
+    from font_collector import FontLoader
+
+    return tuple(FontLoader.load_system_fonts())
+
+
 def collect_fonts(
     sub: SubFile,
     use_system_fonts: bool = True,
@@ -85,9 +94,12 @@ def collect_fonts(
 
     from font_collector import AssDocument, FontLoader, FontCollection, FontSelectionStrategyLibass, ABCFontFace
 
-    font_collection = FontCollection(
-        use_system_fonts, additional_fonts=FontLoader.load_additional_fonts(additional_fonts, scan_subdirs=True) if additional_fonts else []
-    )
+    # Same order FontCollection uses itself (system, generated, additional) but with the cached system fonts
+    fonts = list(_load_system_fonts()) if use_system_fonts else []
+    fonts.extend(FontLoader.load_generated_fonts())
+    if additional_fonts:
+        fonts.extend(FontLoader.load_additional_fonts(additional_fonts, scan_subdirs=True))
+    font_collection = FontCollection(False, use_generated_fonts=False, additional_fonts=fonts)
     load_strategy = FontSelectionStrategyLibass()
 
     doc = AssDocument(sub._read_doc())
@@ -1,7 +1,9 @@
 from __future__ import annotations
 from ass import Document, Comment, Dialogue, Style, parse as parseDoc
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, TypeVar
 from datetime import timedelta
 from fractions import Fraction
@@ -27,9 +29,21 @@ __all__ = ["FontFile", "SubFile", "DEFAULT_DIALOGUE_STYLES"]
 
 DEFAULT_DIALOGUE_STYLES = ["default", "main", "alt", "overlap", "flashback", "top", "italics"]
 SRT_REGEX = r"\d+[\r\n](?:(?P<start>\d+:\d+:\d+,\d+) --> (?P<end>\d+:\d+:\d+,\d+))[\r\n](?P<text>(?:.+\r?\n)+(?=(\r?\n)?))"
+STYLE_RESET_REGEX = re.compile(r"\{[^}]*\\r([^\\}]+)[^}]*\}")
 LINES = list[_Line]
 
 
+@lru_cache(maxsize=None)
+def _autoswap_regexes(inline_marker: str) -> tuple[re.Pattern, re.Pattern, re.Pattern]:
+    """Returns the AB Swap, Show Word and Hide Word patterns for the given inline marker"""
+    marker = re.escape(inline_marker)
+    return (
+        re.compile(rf"{{{marker}}}(.*?){{{marker}([^}}*]+)}}"),
+        re.compile(rf"{{{marker}{marker}([^}}]+)}}"),
+        re.compile(rf"{{{marker}}}(.*?){{{marker} *}}"),
+    )
+
+
 @dataclass
 class FontFile(MuxingFile):
     pass
@@ -49,6 +63,7 @@ class SubFile(BaseSubFile):
     """
 
     encoding = "utf_8_sig"
+    _doc_cache: tuple[tuple[str, int, int], Document] | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if isinstance(self.file, GlobSearch):
@@ -63,15 +78,16 @@ class SubFile(BaseSubFile):
                     docs.append(parseDoc(read))
 
             main = docs[0]
-            existing_styles = [style.name for style in (main.styles)]
+            existing_styles = {style.name.casefold() for style in main.styles}
             docs.remove(main)
 
             for doc in docs:
                 main.events.extend(doc.events)
                 for style in doc.styles:
-                    if style.name.casefold() in [s.casefold() for s in existing_styles]:
+                    if (name := style.name.casefold()) in existing_styles:
                         warn(f"Ignoring style '{style.name}' due to preexisting style of the same name.", self)
                         continue
+                    existing_styles.add(name)
                     main.styles.append(style)
 
             self.source = self.file[0]
@@ -85,10 +101,9 @@ class SubFile(BaseSubFile):
             self.file = ensure_path_exists(self.file, self)
             self.source = self.file
             if not os.path.samefile(self.file.parent, get_workdir()):
-                out = make_output(self.file, "ass", "vof")
-                with open(out, "w", encoding=self.encoding) as writer:
-                    self._read_doc().dump_file(writer)
-                self.file = out
+                doc = self._read_doc()
+                self.file = make_output(self.file, "ass", "vof")
+                self._update_doc(doc)
 
     def manipulate_lines(self: SubFileSelf, func: Callable[[LINES], LINES | None]) -> SubFileSelf:
         """
@@ -130,12 +145,14 @@ class SubFile(BaseSubFile):
         Deletes unused styles from the document.
         """
         doc = self._read_doc()
-        used_styles = {line.style for line in doc.events if line.TYPE == "Dialogue"}
-        regex = re.compile(r"\{[^}]*\\r([^\\}]+)[^}]*\}")
-        for line in [line for line in doc.events if line.TYPE == "Dialogue"]:
-            for match in regex.finditer(line.text):
-                used_styles.add(match.group(1))
-        doc.styles = [style for style in doc.styles if style.name in used_styles]
+        used_styles = set[str]()
+        # Comments count as well since they can be turned back into dialogue (e.g. by the autoswapper)
+        for line in doc.events:
+            used_styles.add(line.style)
+            # Styles can also be referenced with \r override tags
+            if "\\r" in line.text:
+                used_styles.update(match.group(1) for match in STYLE_RESET_REGEX.finditer(line.text))
+        doc.styles[:] = [style for style in doc.styles if style.name in used_styles]
         self._update_doc(doc)
         return self
 
@@ -220,54 +237,54 @@ class SubFile(BaseSubFile):
                 warn("Given invalid inline comment markers. Using default 'None'.", self)
                 inline_tag_markers = None
 
-        marker = re.escape(inline_marker)
-
-        ab_swap_regex = re.compile(rf"{{{marker}}}(.*?){{{marker}([^}}*]+)}}")
-        show_word_regex = re.compile(rf"{{{marker}{marker}([^}}]+)}}")
-        hide_word_regex = re.compile(rf"{{{marker}}}(.*?){{{marker} *}}")
+        ab_swap_regex, show_word_regex, hide_word_regex = _autoswap_regexes(inline_marker)
+        allowed = {style.casefold() for style in allowed_styles} if allowed_styles else None
+        # Every inline swap starts with this so lines without it can skip the regex scans
+        swap_prefix = "{" + inline_marker
 
         backslash = "\\" # This is to ensure support for previous python versions that don't allow backslashes in f-strings.
 
         def _do_autoswap(lines: LINES):
             for i, line in enumerate(lines):
-                if not allowed_styles or str(line.style).casefold() in {style.casefold() for style in allowed_styles}:
+                if not allowed or str(line.style).casefold() in allowed:
                     to_swap: dict = {}
-                    # {*}This will be replaced{*With this}
-                    for match in re.finditer(ab_swap_regex, line.text):
-                        if inline_tag_markers:
-                            to_swap.update(
-                                {
-                                    f"{match.group(0)}": f"{{{inline_marker}}}{match.group(2).replace(inline_tag_markers[0], '{').replace(inline_tag_markers[1], '}').replace('/', backslash)}{{{inline_marker}{match.group(1).replace('{', inline_tag_markers[0]).replace('}', inline_tag_markers[1], ).replace(backslash, '/')}}}"
-                                }
-                            )
-                        else:
-                            to_swap.update(
-                                {
-                                    f"{match.group(0)}": f"{{{inline_marker}}}{match.group(2)}{{{inline_marker}{match.group(1).replace('{', '').replace('}', '')}}}"
-                                }
-                            )
-
-                    # This sentence is no longer{** incomplete}
-                    for match in re.finditer(show_word_regex, line.text):
-                        if inline_tag_markers:
-                            to_swap.update(
-                                {
-                                    f"{match.group(0)}": f"{{{inline_marker}}}{match.group(1).replace(inline_tag_markers[0], '{').replace(inline_tag_markers[1], '}').replace('/', backslash)}{{{inline_marker}}}"
-                                }
-                            )
-                        else:
-                            to_swap.update({f"{match.group(0)}": f"{{{inline_marker}}}{match.group(1)}{{{inline_marker}}}"})
-
-                    # This sentence is no longer{*} complete{*}
-                    for match in re.finditer(hide_word_regex, line.text):
-                        if inline_tag_markers:
-                            to_swap.update(
-                                {
-                                    f"{match.group(0)}": f"{{{inline_marker*2}{match.group(1).replace('{', inline_tag_markers[0]).replace('}', inline_tag_markers[1]).replace(backslash, '/')}}}"
-                                }
-                            )
-                        else:
-                            to_swap.update({f"{match.group(0)}": f"{{{inline_marker*2}{match.group(1).replace('{', '').replace('}', '')}}}"})
+                    if swap_prefix in line.text:
+                        # {*}This will be replaced{*With this}
+                        for match in ab_swap_regex.finditer(line.text):
+                            if inline_tag_markers:
+                                to_swap.update(
+                                    {
+                                        f"{match.group(0)}": f"{{{inline_marker}}}{match.group(2).replace(inline_tag_markers[0], '{').replace(inline_tag_markers[1], '}').replace('/', backslash)}{{{inline_marker}{match.group(1).replace('{', inline_tag_markers[0]).replace('}', inline_tag_markers[1], ).replace(backslash, '/')}}}"
+                                    }
+                                )
+                            else:
+                                to_swap.update(
+                                    {
+                                        f"{match.group(0)}": f"{{{inline_marker}}}{match.group(2)}{{{inline_marker}{match.group(1).replace('{', '').replace('}', '')}}}"
+                                    }
+                                )
+
+                        # This sentence is no longer{** incomplete}
+                        for match in show_word_regex.finditer(line.text):
+                            if inline_tag_markers:
+                                to_swap.update(
+                                    {
+                                        f"{match.group(0)}": f"{{{inline_marker}}}{match.group(1).replace(inline_tag_markers[0], '{').replace(inline_tag_markers[1], '}').replace('/', backslash)}{{{inline_marker}}}"
+                                    }
+                                )
+                            else:
+                                to_swap.update({f"{match.group(0)}": f"{{{inline_marker}}}{match.group(1)}{{{inline_marker}}}"})
+
+                        # This sentence is no longer{*} complete{*}
+                        for match in hide_word_regex.finditer(line.text):
+                            if inline_tag_markers:
+                                to_swap.update(
+                                    {
+                                        f"{match.group(0)}": f"{{{inline_marker*2}{match.group(1).replace('{', inline_tag_markers[0]).replace('}', inline_tag_markers[1]).replace(backslash, '/')}}}"
+                                    }
+                                )
+                            else:
+                                to_swap.update({f"{match.group(0)}": f"{{{inline_marker*2}{match.group(1).replace('{', '').replace('}', '')}}}"})
 
                     for key, val in to_swap.items():
                         if print_swaps:
@@ -309,39 +326,40 @@ class SubFile(BaseSubFile):
         :param alt_styles:          Possible identifiers for styles that should be set to the alt_style
         """
 
-        def get_default(line: _Line, allow_default: bool = True) -> str:
-            placeholder = default_style
-            is_default = True
-            if alt_styles:
-                for s in alt_styles:
-                    if s.casefold() in line.style.casefold():
-                        placeholder = alt_style
-                        is_default = False
-            if "flashback" in line.style.lower():
+        dialogue_cf = [s.casefold() for s in dialogue_styles or []]
+        top_cf = [s.casefold() for s in top_styles or []]
+        italics_cf = [s.casefold() for s in italics_styles or []]
+        alt_cf = [s.casefold() for s in alt_styles or []]
+
+        def get_default(style: str, allow_default: bool = True) -> str:
+            style_cf = style.casefold()
+            is_default = not any(s in style_cf for s in alt_cf)
+            placeholder = default_style if is_default else alt_style
+            if "flashback" in style_cf:
                 return placeholder if not keep_flashback else "Flashback"
 
             if is_default:
-                return placeholder if allow_default else line.style
+                return placeholder if allow_default else style
 
             return placeholder
 
         def _func(lines: LINES):
             for line in lines:
-                add_italics_tag = italics_styles and bool([s for s in italics_styles if s.casefold() in line.style.casefold()])
-                add_top_tag = top_styles and bool([s for s in top_styles if s.casefold() in line.style.casefold()])
+                style_cf = line.style.casefold()
+                add_italics_tag = any(s in style_cf for s in italics_cf)
+                add_top_tag = any(s in style_cf for s in top_cf)
 
-                if any([add_italics_tag, add_top_tag]):
-                    line.style = get_default(line)
+                if add_italics_tag or add_top_tag:
+                    line.style = get_default(line.style)
                     tags = "" if not add_italics_tag else R"\i1"
                     tags = tags if not add_top_tag else tags + R"\an8"
                     line.text = f"{{{tags}}}{line.text}"
 
-                line.style = get_default(line, False)
+                line.style = get_default(line.style, False)
 
-                if dialogue_styles:
-                    for s in dialogue_styles:
-                        if s.casefold() in line.style.casefold():
-                            line.style = default_style
+                style_cf = line.style.casefold()
+                if any(s in style_cf for s in dialogue_cf):
+                    line.style = default_style
 
         return self.manipulate_lines(_func).clean_styles()
 
@@ -358,9 +376,11 @@ class SubFile(BaseSubFile):
         :param allowed_styles:  A list of style names this will run on. Will run on every line if None.
         """
 
+        allowed = {style.casefold() for style in allowed_styles} if allowed_styles else None
+
         def _func(lines: LINES):
             for line in lines:
-                if not allowed_styles or line.style.lower() in allowed_styles:
+                if not allowed or str(line.style).casefold() in allowed:
                     line.start = frame_to_timedelta(timedelta_to_frame(line.start, fps, exclude_boundary=True), fps, True)
                     line.end = frame_to_timedelta(timedelta_to_frame(line.end, fps, exclude_boundary=True), fps, True)
 
@@ -396,15 +416,16 @@ class SubFile(BaseSubFile):
 
         events = []
         tomerge = []
-        existing_styles = [style.name for style in doc.styles]
+        existing_styles = {style.name for style in doc.styles}
         target = None if not isinstance(sync, int) else sync
+        sync_field = "name" if use_actor_field else "effect"
 
         # Find syncpoint in current document if sync is a string
+        syncpoint = sync.lower().strip() if isinstance(sync, str) else None
         for line in doc.events:
             events.append(line)
-            if target is None and isinstance(sync, str):
-                field = line.name if use_actor_field else line.effect
-                if field.lower().strip() == sync.lower().strip() or line.text.lower().strip() == sync.lower().strip():
+            if target is None and syncpoint is not None:
+                if getattr(line, sync_field).lower().strip() == syncpoint or line.text.lower().strip() == syncpoint:
                     target = timedelta_to_frame(line.start, fps, exclude_boundary=True) + 1
 
         if target is None and isinstance(sync, str):
@@ -416,18 +437,18 @@ class SubFile(BaseSubFile):
 
         # Find second syncpoint if any
         second_sync: int | None = None
-        for line in mergedoc.events:
-            if not isinstance(sync, str) and not sync2:
+        if isinstance(sync, str) or sync2:
+            sync2 = sync2 or sync
+        syncpoint2 = sync2.lower().strip() if sync2 else None
+        for i, line in enumerate(mergedoc.events):
+            if syncpoint2 is None:
                 break
-            else:
-                sync2 = sync2 or sync
-            field = line.name if use_actor_field else line.effect
-            if field.lower().strip() == sync2.lower().strip() or line.text.lower().strip() == sync2.lower().strip():
+            if getattr(line, sync_field).lower().strip() == syncpoint2 or line.text.lower().strip() == syncpoint2:
                 second_sync = timedelta_to_frame(line.start, fps, exclude_boundary=True) + 1
-                mergedoc.events.remove(line)
+                del mergedoc.events[i]
                 break
 
-        sorted_lines = sorted(mergedoc.events, key=lambda event: event.start)
+        sorted_lines = sorted(mergedoc.events, key=attrgetter("start"))
 
         # Assume the first line to be the second syncpoint if none was found
         if second_sync is None:
@@ -454,6 +475,7 @@ class SubFile(BaseSubFile):
             for style in mergedoc.styles:
                 if style.name in existing_styles:
                     continue
+                existing_styles.add(style.name)
                 doc.styles.append(style)
 
         self._update_doc(doc)
@@ -484,8 +506,8 @@ class SubFile(BaseSubFile):
         :return:                        A list of FontFile objects
         """
 
-        if not isinstance(additional_fonts, list):
-            additional_fonts = [additional_fonts]
+        # Copy so the mutable default doesn't grow with every call
+        additional_fonts = list(additional_fonts) if isinstance(additional_fonts, list) else [additional_fonts]
 
         if search_current_dir:
             additional_fonts.append(os.getcwd())
@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from functools import lru_cache
 from ass import Document
 
 from ..utils.log import error
@@ -23,6 +24,7 @@ def create_document() -> Document:
     return doc
 
 
+@lru_cache(maxsize=1)
 def has_arch_resampler() -> bool:
     aegicli = Path(get_executable("aegisub-cli", False))
     sourcedir = Path(aegicli.parent, "automation")
@@ -34,7 +36,8 @@ def has_arch_resampler() -> bool:
         check.append(Path(Path.home(), ".aegisub", "automation"))
 
     for d in check:
-        for f in d.rglob("*"):
+        # Only moonscript files are of interest so don't even yield anything else
+        for f in d.rglob("*.[mM][oO][oO][nN]"):
             if f.name.lower() == "arch.resample.moon":
                 return True
 
@@ -43,10 +43,23 @@ tools = [
 # TODO: check CPU to decide on which x264/5 file to use
 
 
+_found_executables: dict[tuple[str, str | None], str] = {}
+
+
+def _which(type: str) -> str | None:
+    # Avoids walking PATH for every encoder/extractor instance.
+    # Only hits are cached and PATH is part of the key so that changes to it or newly installed tools still get picked up
+    key = (type, os.environ.get("PATH"))
+    if (cached := _found_executables.get(key)) and os.path.isfile(cached):
+        return cached
+    if (path := sh.which(type)) is not None:
+        _found_executables[key] = path
+    return path
+
+
 def get_executable(type: str, can_download: bool | None = None, can_error: bool = True) -> str:
     if can_download is None:
         can_download = download_allowed()
-    path = sh.which(type)
     env = os.environ.get(f"vof_exe_{type.lower()}", None)
     if env:
         path = Path(env)
@@ -57,6 +70,7 @@ def get_executable(type: str, can_download: bool | None = None, can_error: bool
                 return None
             raise error(f"Custom executable for {type} not found!", get_executable)
 
+    path = _which(type)
     if path is None:
         if not can_download or can_download is False:
             if os.name == "nt" and (exe := _find_downloaded_binary(type)):
@@ -72,17 +86,25 @@ def get_executable(type: str, can_download: bool | None = None, can_error: bool
     return str(path)
 
 
+_downloaded_binaries: dict[tuple[str, str], Path] = {}
+
+
 def _find_downloaded_binary(type: str) -> Path | None:
     binary_dir = Path(os.path.join(os.getcwd(), "_binaries"))
-    binary_dir.mkdir(exist_ok=True)
-
     type = type.lower()
 
+    # Only hits are cached so that a later download still gets picked up
+    if (cached := _downloaded_binaries.get((str(binary_dir), type))) and cached.is_file():
+        return cached
+
+    binary_dir.mkdir(exist_ok=True)
     executables = binary_dir.rglob(type + "*.exe")
 
     for exe in sorted(executables):
         if exe.is_file():
-            return exe.resolve()
+            exe = exe.resolve()
+            _downloaded_binaries[(str(binary_dir), type)] = exe
+            return exe
     return None
 
 
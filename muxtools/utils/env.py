@@ -4,6 +4,7 @@ import json
 import subprocess
 from pathlib import Path
 from typing import Any
+from functools import lru_cache
 
 from ..main import Setup
 from .types import PathLike
@@ -22,15 +23,33 @@ __all__ = [
 ]
 
 
+# Snapshot of the last Setup saved in this process.
+# The environment variable is still written for child processes and only read if nothing was saved here.
+_setup_snapshot: dict[str, Any] | None = None
+
+
 def save_setup(setup: Setup):
-    os.environ["vof_setup"] = setup._toJson()
+    global _setup_snapshot
+    envi = setup._toJson()
+    os.environ["vof_setup"] = envi
+    _setup_snapshot = json.loads(envi)
 
 
-def get_setup_attr(attr: str, default: Any = None) -> Any:
+@lru_cache(maxsize=4)
+def _parse_setup(envi: str) -> Any:
+    # Keyed on the raw json so a new Setup automatically invalidates this
+    return json.loads(envi)
+
+
+def _get_setup() -> Any:
+    if _setup_snapshot is not None:
+        return _setup_snapshot
     envi = os.environ.get("vof_setup")
-    if not envi:
-        return default
-    loaded = json.loads(envi)
+    return _parse_setup(envi) if envi else None
+
+
+def get_setup_attr(attr: str, default: Any = None) -> Any:
+    loaded = _get_setup()
     if loaded:
         if isinstance(loaded, dict):
             return loaded.get(attr, default)
@@ -39,10 +58,9 @@ def get_setup_attr(attr: str, default: Any = None) -> Any:
 
 
 def get_setup_dir() -> list[str]:
-    envi = os.environ.get("vof_setup")
-    if not envi:
+    loaded = _get_setup()
+    if not loaded:
         return []
-    loaded = json.loads(envi)
     return loaded.keys() if isinstance(loaded, dict) else dir(loaded)
 
 
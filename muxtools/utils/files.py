@@ -1,6 +1,7 @@
 import os
 import re
-import binascii
+import zlib
+from stat import S_ISDIR
 from typing import Any
 from pathlib import Path
 from shutil import rmtree
@@ -56,16 +57,20 @@ def ensure_path_exists(pathIn: PathLike | list[PathLike] | GlobSearch, caller: A
     if isinstance(pathIn, list):
         pathIn = pathIn[0]
     path = ensure_path(pathIn, caller)
-    if not path.exists():
+    # A single stat call covers both checks
+    try:
+        mode = os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
         raise crit(f"Path target '{path}' does not exist.", caller)
-    if not allow_dir and path.is_dir():
+    if not allow_dir and S_ISDIR(mode):
         raise crit("Path cannot be a directory.", caller)
     return path
 
 
 def uniquify_path(path: PathLike) -> str:
     """
-    Extends path to not conflict with existing files
+    Extends path to not conflict with existing files.
+    Assumes the existing " (n)" copies are numbered without gaps, so if some were deleted the result may not be the lowest free number.
 
     :param file:        Input file
 
@@ -75,14 +80,29 @@ def uniquify_path(path: PathLike) -> str:
     if isinstance(path, Path):
         path = str(path.resolve())
 
+    if not os.path.exists(path):
+        return path
+
     filename, extension = os.path.splitext(path)
-    counter = 1
 
-    while os.path.exists(path):
-        path = filename + " (" + str(counter) + ")" + extension
-        counter += 1
+    def candidate(counter: int) -> str:
+        return f"{filename} ({counter}){extension}"
 
-    return path
+    # Double the counter until a free one is found and then binary search between the last taken and that one.
+    # This keeps the amount of checks logarithmic for directories with lots of existing copies.
+    # It assumes contiguous numbering and may skip gaps, but the returned candidate is always free.
+    taken, free = 0, 1
+    while os.path.exists(candidate(free)):
+        taken, free = free, free * 2
+
+    while free - taken > 1:
+        middle = (taken + free) // 2
+        if os.path.exists(candidate(middle)):
+            taken = middle
+        else:
+            free = middle
+
+    return candidate(free)
 
 
 def get_crc32(file: PathLike) -> str:
@@ -93,9 +113,19 @@ def get_crc32(file: PathLike) -> str:
 
     :return:            Checksum for file
     """
-    buf = open(file, "rb").read()
-    buf = binascii.crc32(buf) & 0xFFFFFFFF
-    return "%08X" % buf
+    crc = 0
+    # Read in chunks so multi GB files don't end up in memory at once and reuse the same buffer for all of them
+    buffer = memoryview(bytearray(1 << 20))
+    with open(file, "rb", buffering=0) as f:
+        while read := f.readinto(buffer):
+            crc = zlib.crc32(buffer[:read], crc)
+    return "%08X" % (crc & 0xFFFFFFFF)
+
+
+def _file_key(file: PathLike) -> tuple[str, int, int]:
+    """Identifies a file and its current state so caches notice when it gets modified or replaced"""
+    stat = os.stat(file)
+    return (str(file), stat.st_mtime_ns, stat.st_size)
 
 
 def clean_temp_files():
@@ -140,7 +170,11 @@ def make_output(source: PathLike, ext: str, suffix: str = "", user_passed: PathL
 def get_track_list(file: PathLike, caller: Any = None) -> list[Track]:
     """Makes a sanitized mediainfo track list"""
     caller = caller if caller else get_track_list
-    file = ensure_path_exists(file, caller)
+    return _parse_track_list(ensure_path_exists(file, caller))
+
+
+def _parse_track_list(file: Path) -> list[Track]:
+    # Expects an already validated path
     mediainfo = MediaInfo.parse(file)
 
     filler_tracks = 0
@@ -215,6 +249,12 @@ def find_tracks(
 
     if not name and not lang and not type and not custom_condition:
         return []
+
+    if type:
+        if type not in (TrackType.VIDEO, TrackType.AUDIO, TrackType.SUB):
+            raise error("You can only search for video, audio and subtitle tracks!", find_tracks)
+        type_string = (str(type.name) if type != TrackType.SUB else "Text").casefold()
+
     tracks = get_track_list(file)
 
     def name_matches(title: str) -> bool:
@@ -228,25 +268,25 @@ def find_tracks(
         languages: list[str] = getattr(track, "other_language", None) or list[str]()
         return [lang.casefold() for lang in languages]
 
-    if name is not None:
-        tracks = [track for track in tracks if name_matches(getattr(track, "title", "") or "")]
-
-    if lang:
-        if reverse_lang:
-            tracks = [track for track in tracks if lang.casefold() not in get_languages(track)]
-        else:
-            tracks = [track for track in tracks if lang.casefold() in get_languages(track)]
+    # Checks are ordered from cheapest to most expensive and bail out on the first mismatch
+    def matches(track: Track) -> bool:
+        if type and track.track_type.casefold() != type_string:
+            return False
+        if lang and (lang.casefold() in get_languages(track)) == reverse_lang:
+            return False
+        if name is not None and not name_matches(getattr(track, "title", "") or ""):
+            return False
+        return not custom_condition or bool(custom_condition(track))
 
-    if type:
-        if type not in (TrackType.VIDEO, TrackType.AUDIO, TrackType.SUB):
-            raise error("You can only search for video, audio and subtitle tracks!", find_tracks)
-        type_string = (str(type.name) if type != TrackType.SUB else "Text").casefold()
-        tracks = [track for track in tracks if track.track_type.casefold() == type_string]
+    return [track for track in tracks if matches(track)]
 
-    if custom_condition:
-        tracks = [track for track in tracks if custom_condition(track)]
 
-    return tracks
+# Mediainfo track type and the name used in errors
+_ABSOLUTE_TRACK_TYPES = {
+    TrackType.VIDEO: ("video", "video"),
+    TrackType.AUDIO: ("audio", "audio"),
+    TrackType.SUB: ("text", "subtitle"),
+}
 
 
 def get_absolute_track(file: PathLike, track: int, type: TrackType, caller: Any = None, quiet_fail: bool = False) -> Track:
@@ -262,36 +302,20 @@ def get_absolute_track(file: PathLike, track: int, type: TrackType, caller: Any
     caller = caller if caller else get_absolute_track
     file = ensure_path_exists(file, caller)
 
-    tracks = get_track_list(file, caller)
-    videos = [track for track in tracks if track.track_type.casefold() == "Video".casefold()]
-    audios = [track for track in tracks if track.track_type.casefold() == "Audio".casefold()]
-    subtitles = [track for track in tracks if track.track_type.casefold() == "Text".casefold()]
-    no_track_msg = "Your requested track doesn't exist."
-
-    match type:
-        case TrackType.VIDEO:
-            if not videos:
-                raise error(f"No video tracks have been found in '{file.name}'!", caller)
-            try:
-                return videos[track]
-            except:
-                raise error(no_track_msg, caller) if not quiet_fail else LoggingException(no_track_msg)
-        case TrackType.AUDIO:
-            if not audios:
-                raise error(f"No audio tracks have been found in '{file.name}'!", caller)
-            try:
-                return audios[track]
-            except:
-                raise error(no_track_msg, caller) if not quiet_fail else LoggingException(no_track_msg)
-        case TrackType.SUB:
-            if not subtitles:
-                raise error(f"No subtitle tracks have been found in '{file.name}'!", caller)
-            try:
-                return subtitles[track]
-            except:
-                raise error(no_track_msg, caller) if not quiet_fail else LoggingException(no_track_msg)
-        case _:
-            raise error("Not implemented for anything other than Video, Audio or Subtitles.", caller)
+    if type not in _ABSOLUTE_TRACK_TYPES:
+        raise error("Not implemented for anything other than Video, Audio or Subtitles.", caller)
+    track_type, type_name = _ABSOLUTE_TRACK_TYPES[type]
+
+    # Only collect the tracks of the requested type
+    tracks = [t for t in _parse_track_list(file) if t.track_type.casefold() == track_type]
+    if not tracks:
+        raise error(f"No {type_name} tracks have been found in '{file.name}'!", caller)
+
+    try:
+        return tracks[track]
+    except:
+        no_track_msg = "Your requested track doesn't exist."
+        raise error(no_track_msg, caller) if not quiet_fail else LoggingException(no_track_msg)
 
 
 def get_absolute_tracknum(file: PathLike, track: int, type: TrackType, caller: Any = None) -> int:
@@ -24,10 +24,12 @@ logger.setLevel(logging.DEBUG)
 
 
 def _format_msg(msg: str, caller: Any) -> str:
+    if caller is None:
+        return msg
     if caller and not isinstance(caller, str):
-        caller = caller.__class__.__qualname__ if hasattr(caller, "__class__") and caller.__class__.__name__ not in ["function", "method"] else caller
-        caller = caller.__name__ if not isinstance(caller, str) else caller
-    return msg if caller is None else f"[bold]{caller}:[/] {msg}"
+        cls = caller.__class__
+        caller = caller.__name__ if cls.__name__ in ("function", "method") else cls.__qualname__
+    return f"[bold]{caller}:[/] {msg}"
 
 
 def crit(msg: str, caller: Any = None) -> LoggingException:
@@ -1,8 +1,9 @@
+import re
 from enum import IntEnum
 from pathlib import Path
 from typing import Union, Optional
 from datetime import timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 __all__ = [
     "PathLike",
@@ -42,6 +43,19 @@ class AudioFormat:
     ext: str
     codecid: str
     lossy: bool = True
+    _format_pattern: re.Pattern | None = field(default=None, init=False, repr=False, compare=False)
+    _codecid_pattern: re.Pattern | None = field(default=None, init=False, repr=False, compare=False)
+    _format_cf: str = field(default="", init=False, repr=False, compare=False)
+    _codecid_cf: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._format_cf = self.format.casefold()
+        self._codecid_cf = self.codecid.casefold()
+        # Wildcard entries get matched as regex so compile them once here instead of on every lookup
+        if "*" in self.format:
+            self._format_pattern = re.compile(self.format.replace("*", ".*"), re.IGNORECASE)
+        if "*" in self.codecid:
+            self._codecid_pattern = re.compile(self.codecid.replace("*", ".*"), re.IGNORECASE)
 
 
 class DitherType(IntEnum):